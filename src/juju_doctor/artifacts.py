@@ -1,5 +1,7 @@
 """Helper module to represent the input artifacts for Juju doctor."""
 
+import copy
+import functools
 import logging
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
@@ -13,6 +15,21 @@ from rich.logging import RichHandler
 logging.basicConfig(level=logging.WARN, handlers=[RichHandler()])
 log = logging.getLogger(__name__)
 
+# Use the LibYAML-backed loader when PyYAML was built with it, it parses artifacts much faster
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=3)
+def _parse_yaml(contents: str) -> Optional[Dict]:
+    """Parse YAML contents, memoized for the last few artifact or RuleSet files read.
+
+    A single CLI run reads each file once, so only repeated reads of the same contents (e.g.
+    across tests) hit the cache.
+    """
+    # Parse all YAML documents and return only the first one
+    # https://github.com/canonical/juju-doctor/issues/10
+    return list(yaml.load_all(contents, Loader=YamlLoader))[0]
+
 
 def read_file(filename: Optional[str]) -> Optional[Dict]:
     """Read a file into a string."""
@@ -21,9 +38,8 @@ def read_file(filename: Optional[str]) -> Optional[Dict]:
     try:
         with open(filename, "r") as f:
             contents = f.read()
-            # Parse all YAML documents and return only the first one
-            # https://github.com/canonical/juju-doctor/issues/10
-            return list(yaml.safe_load_all(contents))[0]
+        # The parsed document is cached, so return a copy which probes are free to mutate
+        return copy.deepcopy(_parse_yaml(contents))
     except Exception as e:
         log.error(e)
     return None
@@ -40,8 +56,12 @@ class ModelArtifact:
     @staticmethod
     def from_live_model(model: str) -> "ModelArtifact":
         """Gather information from a live model."""
-        juju_status = yaml.safe_load(sh.juju.status(model=model, format="yaml", _tty_out=False))
-        bundle = yaml.safe_load(sh.juju("export-bundle", model=model, _tty_out=False))
+        juju_status = yaml.load(
+            sh.juju.status(model=model, format="yaml", _tty_out=False), Loader=YamlLoader
+        )
+        bundle = yaml.load(
+            sh.juju("export-bundle", model=model, _tty_out=False), Loader=YamlLoader
+        )
         # Get unit data information
         units: List[str] = []
         show_units: Dict[str, Any] = {}  # List of show-unit results in dictionary form
@@ -56,8 +76,9 @@ class ModelArtifact:
                     if "subordinates" in unit_status:
                         units.extend(unit_status["subordinates"].keys())
         for unit in units:
-            show_unit = yaml.safe_load(
-                sh.juju("show-unit", unit, model=model, format="yaml", _tty_out=False)
+            show_unit = yaml.load(
+                sh.juju("show-unit", unit, model=model, format="yaml", _tty_out=False),
+                Loader=YamlLoader,
             )
             show_units.update(show_unit)
 
@@ -132,6 +132,7 @@ class Probe:
     probe_definition: Optional["ProbeDefinition"] = None
     results: List[AssertionResult] = field(default_factory=list)
     uuid: UUID = field(default_factory=uuid4)
+    _functions: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def name(self) -> str:
@@ -254,7 +255,13 @@ class Probe:
 
         We import the module dynamically because the path of the probe is only known at runtime.
         Only returns the supported 'status', 'bundle', and 'show_unit' functions (if present).
+
+        The module is executed once per Probe, subsequent calls (e.g. one per 'with' entry of a
+        builtin) reuse the same functions.
         """
+        if self._functions is not None:
+            return self._functions
+
         package_name = "juju_doctor"
 
         # module from filesystem path
@@ -279,11 +286,12 @@ class Probe:
         exec(compile(src_text, origin, "exec"), module.__dict__)
 
         # Return the functions defined in the probe module
-        return {
+        self._functions = {
             name: func
             for name, func in inspect.getmembers(module, inspect.isfunction)
             if name in SUPPORTED_PROBE_FUNCTIONS
         }
+        return self._functions
 
     def run(self, artifacts: Artifacts, **kwargs):
         """Execute each Probe function that matches the supported probe types.
@@ -401,7 +409,7 @@ class RuleSet:
             self.content = None
         else:
             try:
-                self.content = RuleSetModel(**contents)
+                self.content = RuleSetModel.model_validate(contents)
             except ValidationError as e:
                 self.content = None
                 log.error(e)
@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
@@ -82,7 +82,11 @@ class ResultAggregator:
                 if pass_string or fail_string:
                     console.print(f"\nTotal: {pass_string} {fail_string}")
             case CheckFormat.json.value:
-                tree_json = json.loads(self._tree.to_json())
+                tree_dict = self._tree.to_dict()
+                # treelib collapses a childless root into its bare tag, keep the JSON shape stable
+                if not isinstance(tree_dict, dict):
+                    tree_dict = {str(tree_dict): {"children": []}}
+                tree_json: Dict[str, Any] = tree_dict
                 meta_json = {
                     "passed": passed,
                     "failed": failed,
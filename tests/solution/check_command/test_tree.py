@@ -1,42 +1,39 @@
 import json
-from typing import Dict, List
-
-from typer.testing import CliRunner
+from typing import Dict, List, Union
 
 from juju_doctor.constants import ROOT_NODE_TAG
 from juju_doctor.main import app
 
 
+def _index_nodes(tree: List[Union[str, Dict[str, Dict]]]) -> Dict[str, Dict]:
+    """Map each node's tag to its value, treating leaf nodes (plain tags) as empty nodes."""
+    return {
+        key: value
+        for node in tree
+        for key, value in (node.items() if isinstance(node, dict) else [(node, {})])
+    }
+
+
 def assert_tree_structure(
-    actual_tree: List[Dict[str, Dict]], expected_tree: List[Dict[str, Dict]]
+    actual_tree: List[Union[str, Dict[str, Dict]]], expected_tree: List[Dict[str, Dict]]
 ):
-    """Iterate through each node in the expected_tree and compare to the actual_tree."""
+    """Recursively compare each node in the expected_tree to the actual_tree."""
+    actual_by_key = _index_nodes(actual_tree)
     for expected in expected_tree:
         for key, value in expected.items():
-            node_found = False
-            for node in actual_tree:
-                if key not in node:
-                    continue
-                node_found = True
-                if "children" not in value:
-                    continue
-                expected_children = value["children"]
-                actual_children = node[key]["children"]
-                assert len(actual_children) == len(expected_children), (
-                    f"Child count mismatch for '{key}'."
-                )
-                for expected_child in expected_children:
-                    for child_key in expected_child.keys():
-                        child_found = any(
-                            child_key in actual_child for actual_child in actual_children
-                        )
-                        assert child_found, f"Child '{child_key}' not found in '{key}'."
-                break
-
-            assert node_found, f"Key '{key}' not found in nodes."
+            node = actual_by_key.get(key)
+            assert node is not None, f"Key '{key}' not found in nodes."
+            if "children" not in value:
+                continue
+            expected_children = value["children"]
+            actual_children = node.get("children", [])
+            assert len(actual_children) == len(expected_children), (
+                f"Child count mismatch for '{key}'."
+            )
+            assert_tree_structure(actual_children, expected_children)
 
 
-def test_check_groups_by_parent():
+def test_check_groups_by_parent(runner):
     # GIVEN multiple Ruleset probes
     test_args = [
         "check",
@@ -47,7 +44,7 @@ def test_check_groups_by_parent():
         "--status=tests/resources/artifacts/status.yaml",
     ]
     # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     check_result = json.loads(result.output)
@@ -92,7 +89,7 @@ def test_check_groups_by_parent():
     assert_tree_structure(nodes, expected_tree)
 
 
-def test_check_probes_and_builtins():
+def test_check_probes_and_builtins(runner):
     # GIVEN a Ruleset with probes and builtins
     test_args = [
         "check",
@@ -104,7 +101,7 @@ def test_check_probes_and_builtins():
         "--show-unit=tests/resources/artifacts/show-unit.yaml",
     ]
     # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     check_result = json.loads(result.output)
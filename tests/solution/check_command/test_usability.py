@@ -3,12 +3,16 @@ import os
 import re
 
 import pytest
-from typer.testing import CliRunner
 
 from juju_doctor.main import app
 
+STATUS_NOT_USED_RE = re.compile(r"status.*not used")
+SHOW_UNIT_NOT_USED_RE = re.compile(r"show_unit.*not used")
+NO_BUNDLE_PROVIDED_RE = re.compile(r"No.*bundle.*provided")
+NO_SHOW_UNIT_PROVIDED_RE = re.compile(r"No.*show_unit.*provided")
 
-def test_no_probes():
+
+def test_no_probes(runner):
     # GIVEN no probes were provided
     test_args = [
         "check",
@@ -16,14 +20,14 @@ def test_no_probes():
         "--status=tests/resources/artifacts/status.yaml",
     ]
     # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN the command fails
     assert result.exit_code == 2
     # AND the command fails
     assert "No probes were specified" in result.output
 
 
-def test_no_artifacts():
+def test_no_artifacts(runner):
     # GIVEN no artifacts were provided
     test_args = [
         "check",
@@ -31,14 +35,14 @@ def test_no_artifacts():
         "--probe=file://tests/resources/probes/python/mixed.py",
     ]
     # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN the command fails
     assert result.exit_code == 2
     # AND the command fails
     assert "No artifacts were specified" in result.output
 
 
-def test_check_multiple_artifacts():
+def test_check_multiple_artifacts(runner):
     # GIVEN a file probe, missing the Status artifact
     # AND all artifacts are provided
     test_args = [
@@ -49,15 +53,16 @@ def test_check_multiple_artifacts():
         "--show-unit=tests/resources/artifacts/show-unit.yaml",
     ]
     # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND only the functions with artifacts are executed
-    assert json.loads(result.stdout)["passed"] == 0
-    assert json.loads(result.stdout)["failed"] == 1
+    output = json.loads(result.stdout)
+    assert output["passed"] == 0
+    assert output["failed"] == 1
 
 
-def test_check_multiple_probes():
+def test_check_multiple_probes(runner):
     # GIVEN multiple probes and a Status artifact
     test_args = [
         "check",
@@ -67,15 +72,16 @@ def test_check_multiple_probes():
         "--status=tests/resources/artifacts/status.yaml",
     ]
     # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND only the status functions are executed
-    assert json.loads(result.stdout)["failed"] == 1
-    assert json.loads(result.stdout)["passed"] == 1
+    output = json.loads(result.stdout)
+    assert output["failed"] == 1
+    assert output["passed"] == 1
 
 
-def test_check_unused_probe_artifacts(caplog):
+def test_check_unused_probe_artifacts(caplog, runner):
     # GIVEN a probe is missing the Status artifact
     # AND this artifact is provided
     test_args = [
@@ -85,14 +91,14 @@ def test_check_unused_probe_artifacts(caplog):
     ]
     # WHEN `juju-doctor check` is executed
     with caplog.at_level("WARNING"):
-        result = CliRunner().invoke(app, test_args)
+        result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND the user is warned of their mistake
-    assert re.search(r"status.*not used", caplog.text)
+    assert STATUS_NOT_USED_RE.search(caplog.text)
 
 
-def test_check_unused_builtin_artifacts(caplog):
+def test_check_unused_builtin_artifacts(caplog, runner):
     # GIVEN a RuleSet probe does not use the Show-unit artifact
     # AND this artifact is provided
     test_args = [
@@ -102,14 +108,14 @@ def test_check_unused_builtin_artifacts(caplog):
     ]
     # WHEN `juju-doctor check` is executed
     with caplog.at_level("WARNING"):
-        result = CliRunner().invoke(app, test_args)
+        result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND the user is warned of their mistake
-    assert re.search(r"show_unit.*not used", caplog.text)
+    assert SHOW_UNIT_NOT_USED_RE.search(caplog.text)
 
 
-def test_check_probe_missing_required_artifacts(caplog):
+def test_check_probe_missing_required_artifacts(caplog, runner):
     # GIVEN a probe requires all artifacts
     test_args = [
         "check",
@@ -118,15 +124,15 @@ def test_check_probe_missing_required_artifacts(caplog):
     ]
     # WHEN `juju-doctor check` is executed
     with caplog.at_level("WARNING"):
-        result = CliRunner().invoke(app, test_args)
+        result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND the user is warned of their mistake
-    assert re.search(r"No.*bundle.*provided", caplog.text)
-    assert re.search(r"No.*show_unit.*provided", caplog.text)
+    assert NO_BUNDLE_PROVIDED_RE.search(caplog.text)
+    assert NO_SHOW_UNIT_PROVIDED_RE.search(caplog.text)
 
 
-def test_check_builtin_missing_required_artifacts(caplog):
+def test_check_builtin_missing_required_artifacts(caplog, runner):
     # GIVEN a RuleSet probe requires Status and Bundle artifacts
     test_args = [
         "check",
@@ -135,14 +141,14 @@ def test_check_builtin_missing_required_artifacts(caplog):
     ]
     # WHEN `juju-doctor check` is executed
     with caplog.at_level("WARNING"):
-        result = CliRunner().invoke(app, test_args)
+        result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND the user is warned of their mistake
-    assert re.search(r"No.*bundle.*provided", caplog.text)
+    assert NO_BUNDLE_PROVIDED_RE.search(caplog.text)
 
 
-def test_check_returns_valid_json():
+def test_check_returns_valid_json(runner):
     # GIVEN any probe
     test_args = [
         "check",
@@ -151,7 +157,7 @@ def test_check_returns_valid_json():
         "--status=tests/resources/artifacts/status.yaml",
     ]
     # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND the result is valid JSON
@@ -161,17 +167,28 @@ def test_check_returns_valid_json():
         assert False, f"Output is not valid JSON: {e}\nOutput:\n{result.output}"
 
 
-def test_duplicate_file_probes_are_excluded():
-    # GIVEN 2 duplicate file probes
+@pytest.mark.parametrize(
+    "probe_url",
+    [
+        pytest.param("file://tests/resources/probes/python/failing.py", id="file"),
+        pytest.param(
+            "github://canonical/juju-doctor//tests/resources/probes/python/failing.py?main",
+            id="github",
+            marks=pytest.mark.github,
+        ),
+    ],
+)
+def test_duplicate_probes_are_excluded(runner, probe_url):
+    # GIVEN 2 duplicate probes
     test_args = [
         "check",
         "--format=json",
-        "--probe=file://tests/resources/probes/python/failing.py",
-        "--probe=file://tests/resources/probes/python/failing.py",
+        f"--probe={probe_url}",
+        f"--probe={probe_url}",
         "--status=tests/resources/artifacts/status.yaml",
     ]
     # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND the second Probe overwrote the first, i.e. only 1 exists
@@ -179,7 +196,7 @@ def test_duplicate_file_probes_are_excluded():
     assert len(failing) == 1
 
 
-def test_duplicate_file_probes_warning(caplog):
+def test_duplicate_file_probes_warning(caplog, runner):
     # GIVEN 2 duplicate file probes
     test_args = [
         "check",
@@ -189,7 +206,7 @@ def test_duplicate_file_probes_warning(caplog):
     ]
     # WHEN `juju-doctor check` is executed
     with caplog.at_level("WARNING"):
-        result = CliRunner().invoke(app, test_args)
+        result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND the user is warned of their mistake
@@ -197,7 +214,7 @@ def test_duplicate_file_probes_warning(caplog):
 
 
 @pytest.mark.github
-def test_check_gh_probe_at_branch():
+def test_check_gh_probe_at_branch(runner):
     # GIVEN a GitHub probe on the main branch
     test_args = [
         "check",
@@ -206,37 +223,19 @@ def test_check_gh_probe_at_branch():
         "--status=tests/resources/artifacts/status.yaml",
     ]
     # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN the command succeeds
     assert result.exit_code == 0
     # AND the Probe was correctly executed
-    assert json.loads(result.stdout)["failed"] == 1
-    assert json.loads(result.stdout)["passed"] == 0
-
-
-@pytest.mark.github
-def test_duplicate_gh_probes_are_excluded():
-    # GIVEN two GitHub probes
-    test_args = [
-        "check",
-        "--format=json",
-        "--probe=github://canonical/juju-doctor//tests/resources/probes/python/failing.py?main",
-        "--probe=github://canonical/juju-doctor//tests/resources/probes/python/failing.py?main",
-        "--status=tests/resources/artifacts/status.yaml",
-    ]
-    # WHEN `juju-doctor check` is executed
-    result = CliRunner().invoke(app, test_args)
-    # THEN the command succeeds
-    assert result.exit_code == 0
-    # AND the second Probe overwrote the first, i.e. only 1 exists
-    failing = json.loads(result.stdout)["Results"]["children"]
-    assert len(failing) == 1
+    output = json.loads(result.stdout)
+    assert output["failed"] == 1
+    assert output["passed"] == 0
 
 
-def test_check_not_from_repo_root(tmp_path):
+def test_check_not_from_repo_root(tmp_path, monkeypatch, runner):
     # GIVEN the current working directory is not the repo root
     orig = os.getcwd()
-    os.chdir(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
     test_args = [
         "check",
         "--format",
@@ -247,7 +246,8 @@ def test_check_not_from_repo_root(tmp_path):
     ]
     # WHEN juju-doctor check is executed on builtins
     # because builtins are not loaded from disk, rather they are loaded from the package
-    result = CliRunner().invoke(app, test_args)
+    result = runner.invoke(app, test_args)
     # THEN they are all found
-    assert json.loads(result.stdout)["failed"] == 0
-    assert json.loads(result.stdout)["passed"] == 3
+    output = json.loads(result.stdout)
+    assert output["failed"] == 0
+    assert output["passed"] == 3
@@ -0,0 +1,8 @@
+import pytest
+from typer.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """A CliRunner shared by all tests, each invocation is isolated by the runner itself."""
+    return CliRunner()
@@ -151,6 +151,18 @@ def test_model_artifact_parsing_from_file():
         assert model_artifact.show_units == yaml.safe_load(JUJU_SHOW_UNIT)
 
 
+def test_model_artifact_parsing_is_not_shared():
+    with patch("builtins.open", side_effect=_open_side_effect):
+        # GIVEN an artifact was parsed and then modified
+        first_artifact = ModelArtifact.from_files(status_file="status.yaml")
+        assert first_artifact.status
+        first_artifact.status["applications"].clear()
+        # WHEN the same artifact is parsed again
+        second_artifact = ModelArtifact.from_files(status_file="status.yaml")
+        # THEN it is unaffected by the previous modification
+        assert second_artifact.status == yaml.safe_load(JUJU_STATUS)
+
+
 def test_only_provided_artifacts():
     with patch("builtins.open", side_effect=_open_side_effect):
         # GIVEN only some (omitting show_unit) artifacts are provided
@@ -1,19 +1,16 @@
-import tempfile
 from pathlib import Path
 
-from src.juju_doctor.probes import Probe
+from juju_doctor.probes import Probe, ProbeTree
 
 
-def get_assertions_count(builtins_groups: dict, key: str) -> int:
-    count = 0
-    for builtins in builtins_groups.values():
-        value = builtins.get(key)
-        if value is not None and hasattr(value, 'assertions'):
-            count += len(value.assertions)
-    return count
+def fetch_ruleset(tmp_path: Path, yaml_content: str) -> ProbeTree:
+    """Write a Ruleset to a file and fetch its probes to the same local filesystem."""
+    ruleset_path = tmp_path / "ruleset.yaml"
+    ruleset_path.write_text(yaml_content)
+    return Probe.from_url(f"file://{ruleset_path}", tmp_path)
 
 
-def test_probes_and_builtins():
+def test_probes_and_builtins(tmp_path):
     # GIVEN a Ruleset with scriptlets and builtins
     yaml_content = """
     name: Test scriptlets and builtins
@@ -26,16 +23,13 @@ def test_probes_and_builtins():
         with:
           - application-name: catalogue
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with open(Path(tmpdir) / "probes_and_builtins.yaml", "w") as temp_file:
-            temp_file.write(yaml_content)
-        # WHEN the probes are fetched to a local filesystem
-        probe_tree = Probe.from_url(f"file://{temp_file.name}", Path(tmpdir))
+    # WHEN the probes are fetched to a local filesystem
+    probe_tree = fetch_ruleset(tmp_path, yaml_content)
     # THEN both the probe and builtin were aggregated
     assert len(probe_tree.probes) == 2
 
 
-def test_nested_builtins():
+def test_nested_builtins(tmp_path):
     # GIVEN a Ruleset (with builtin assertions) executes another Ruleset with builtin assertions
     yaml_content = """
     name: Test nested builtins
@@ -56,10 +50,7 @@ def test_nested_builtins():
         with:
           - offer-name: loki-logging
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with open(Path(tmpdir) / "nested-builtins.yaml", "w") as temp_file:
-            temp_file.write(yaml_content)
-        # WHEN the probes are fetched to a local filesystem
-        probe_tree = Probe.from_url(f"file://{temp_file.name}", Path(tmpdir))
+    # WHEN the probes are fetched to a local filesystem
+    probe_tree = fetch_ruleset(tmp_path, yaml_content)
     # THEN both the top-level and nested builtin assertions were aggregated
     assert len(probe_tree.probes) > 3
@@ -1,40 +1,75 @@
-import tempfile
-from pathlib import Path
+from urllib.error import URLError
 
 import pytest
 
+from juju_doctor.fetcher import parse_terraform_notation
 from juju_doctor.probes import Probe
 
+PYTHON_PROBES_DIR = "tests/resources/probes/python"
+
 
 @pytest.mark.github
-def test_parse_file():
+def test_parse_file(tmp_path):
     # GIVEN a probe file specified in a Github remote on the main branch
-    path_str = "tests/resources/probes/python/failing.py"
+    path_str = f"{PYTHON_PROBES_DIR}/failing.py"
     probe_url = f"github://canonical/juju-doctor//{path_str}?main"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # WHEN the probes are fetched to a local filesystem
-        probe_tree = Probe.from_url(probe_url, Path(tmpdir))
-        probes = probe_tree.probes
-        # THEN only 1 probe exists
-        assert len(probes) == 1
-        probe = probes[0]
-        # AND the Probe was correctly parsed
-        assert probe.name == "canonical_juju-doctor__tests_resources_probes_python_failing.py"
-        assert probe.path == Path(tmpdir) / probe.name
+    # WHEN the probes are fetched to a local filesystem
+    probe_tree = Probe.from_url(probe_url, tmp_path)
+    probes = probe_tree.probes
+    # THEN only 1 probe exists
+    assert len(probes) == 1
+    probe = probes[0]
+    # AND the Probe was correctly parsed
+    assert probe.name == "canonical_juju-doctor__tests_resources_probes_python_failing.py"
+    assert probe.path == tmp_path / probe.name
 
 
 @pytest.mark.github
-def test_parse_dir():
+def test_parse_dir(tmp_path):
     # GIVEN a probe directory specified in a Github remote on the main branch
-    path_str = "tests/resources/probes/python"
-    probe_url = f"github://canonical/juju-doctor//{path_str}?main"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # WHEN the probes are fetched to a local filesystem
-        probe_tree = Probe.from_url(probe_url, Path(tmpdir))
-        probes = probe_tree.probes
-        # THEN each Probe is correctly parsed
-        for probe in probes:
-            file_name = probe.name.split("/")[-1]
-            url_flattened = f"{'tests/resources/probes/python'.replace('/', '_')}/{file_name}"
-            assert probe.name == f"canonical_juju-doctor__{url_flattened}"
-            assert probe.path == Path(tmpdir) / probe.name
+    probe_url = f"github://canonical/juju-doctor//{PYTHON_PROBES_DIR}?main"
+    # WHEN the probes are fetched to a local filesystem
+    probe_tree = Probe.from_url(probe_url, tmp_path)
+    probes = probe_tree.probes
+    # THEN each Probe is correctly parsed
+    expected_dir_name = f"canonical_juju-doctor__{PYTHON_PROBES_DIR.replace('/', '_')}"
+    for probe in probes:
+        file_name = probe.name.split("/")[-1]
+        assert probe.name == f"{expected_dir_name}/{file_name}"
+        assert probe.path == tmp_path / probe.name
+
+
+@pytest.mark.parametrize(
+    "url_without_scheme, expected",
+    [
+        (
+            f"canonical/juju-doctor//{PYTHON_PROBES_DIR}/failing.py",
+            ("canonical", "juju-doctor", f"{PYTHON_PROBES_DIR}/failing.py"),
+        ),
+        (
+            f"canonical/juju-doctor//{PYTHON_PROBES_DIR}",
+            ("canonical", "juju-doctor", PYTHON_PROBES_DIR),
+        ),
+    ],
+)
+def test_parse_terraform_notation(url_without_scheme, expected):
+    # GIVEN a GitHub URL (without scheme) in Terraform notation
+    # WHEN it is parsed
+    # THEN the org, repo and path inside the repo are extracted
+    assert parse_terraform_notation(url_without_scheme) == expected
+
+
+@pytest.mark.parametrize(
+    "url_without_scheme",
+    [
+        f"canonical/juju-doctor/{PYTHON_PROBES_DIR}",
+        f"canonical/juju-doctor//tests//{PYTHON_PROBES_DIR}",
+        f"canonical//{PYTHON_PROBES_DIR}",
+    ],
+)
+def test_parse_terraform_notation_invalid(url_without_scheme):
+    # GIVEN a GitHub URL (without scheme) which is not in Terraform notation
+    # WHEN it is parsed
+    # THEN it is rejected
+    with pytest.raises(URLError):
+        parse_terraform_notation(url_without_scheme)
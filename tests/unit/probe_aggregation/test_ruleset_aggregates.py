@@ -1,7 +1,7 @@
-import tempfile
-from pathlib import Path
 from typing import List
 
+import pytest
+
 from juju_doctor.probes import Probe
 
 
@@ -30,54 +30,26 @@ def contains_only_one_passing_and_failing_probe(probes: List[Probe]):
     assert failing_probe is not None
 
 
-def test_ruleset_calls_scriptlet():
-    # GIVEN a ruleset probe file calls scriptlet probes
-    probe_url = "file://tests/resources/probes/ruleset/scriptlets.yaml"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # WHEN the probe is fetched to a local filesystem
-        probe_tree = Probe.from_url(probe_url, Path(tmpdir))
-        probes = probe_tree.probes
-        # THEN probes are found
-        contains_only_one_passing_and_failing_probe(probes)
-
-
-def test_ruleset_calls_nested():
-    # GIVEN a ruleset probe file calls another ruleset
-    probe_url = "file://tests/resources/probes/ruleset/nested.yaml"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # WHEN the probe is fetched to a local filesystem
-        probe_tree = Probe.from_url(probe_url, Path(tmpdir))
-        probes = probe_tree.probes
-        # THEN probes are found
-        contains_only_one_passing_and_failing_probe(probes)
-
-
-def test_ruleset_calls_dir():
-    # GIVEN a ruleset probe file calls a directory of probes (scriptlet and/or ruleset)
-    probe_url = "file://tests/resources/probes/ruleset/dir.yaml"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # WHEN the probe is fetched to a local filesystem
-        probe_tree = Probe.from_url(probe_url, Path(tmpdir))
-        # THEN probes are found
-        contains_only_one_passing_and_failing_probe(probe_tree.probes)
-
-
-def test_ruleset_finds_probes_and_builtins():
-    # GIVEN a ruleset probe file defines probes and builtins
-    probe_url = "file://tests/resources/probes/ruleset/scriptlets.yaml"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # WHEN the probe is fetched to a local filesystem
-        probe_tree = Probe.from_url(probe_url, Path(tmpdir))
-        # THEN probes are found
-        contains_only_one_passing_and_failing_probe(probe_tree.probes)
-
-
-def test_ruleset_calls_scriptlet_with_query_in_url():
-    # GIVEN a ruleset probe file calls scriptlet probes whose URLs have a query parameter
-    probe_url = "file://tests/resources/probes/ruleset/scriptlets_with_query.yaml"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # WHEN the probes are fetched to a local filesystem
-        probe_tree = Probe.from_url(probe_url, Path(tmpdir))
-        probes = probe_tree.probes
-        # THEN probes are found (i.e. the query parameter is not mistaken as part of the extension)
-        contains_only_one_passing_and_failing_probe(probes)
+@pytest.mark.parametrize(
+    "probe_url",
+    [
+        # a ruleset probe file calls scriptlet probes
+        pytest.param("file://tests/resources/probes/ruleset/scriptlets.yaml", id="scriptlet"),
+        # a ruleset probe file calls another ruleset
+        pytest.param("file://tests/resources/probes/ruleset/nested.yaml", id="nested"),
+        # a ruleset probe file calls a directory of probes (scriptlet and/or ruleset)
+        pytest.param("file://tests/resources/probes/ruleset/dir.yaml", id="dir"),
+        # a ruleset probe file calls scriptlet probes whose URLs have a query parameter, i.e. the
+        # query parameter must not be mistaken as part of the extension
+        pytest.param(
+            "file://tests/resources/probes/ruleset/scriptlets_with_query.yaml",
+            id="scriptlet-with-query-in-url",
+        ),
+    ],
+)
+def test_ruleset_aggregates_probes(probe_url, tmp_path):
+    # GIVEN a ruleset probe file
+    # WHEN the probe is fetched to a local filesystem
+    probe_tree = Probe.from_url(probe_url, tmp_path)
+    # THEN probes are found
+    contains_only_one_passing_and_failing_probe(probe_tree.probes)
@@ -1,47 +1,42 @@
-import os
 from pathlib import Path
 
 import pytest
 import yaml
 from pydantic_core import ValidationError
 
+from juju_doctor.artifacts import YamlLoader
 from juju_doctor.probes import RuleSetModel
 
-
-def test_rulesets_have_valid_schemas_in_resources_dir():
-    # GIVEN a directory of ruleset YAML files
-    yaml_files = [
-        os.path.join(root, file)
-        for root, _, files in os.walk("tests/resources/probes/ruleset")
-        for file in files
-        if file.endswith((".yaml", ".yml"))
-    ]
-
-    for file_path in yaml_files:
-        with open(file_path, "r") as f:
-            contents = yaml.safe_load(f)
-            # WHEN the contents are loaded into a Pydantic RuleSetModel
-            invalid_ruleset_dir = "tests/resources/probes/ruleset/invalid"
-            raises_exception = Path(Path(file_path).name).stem.split("-")[0] == "raises"
-            if invalid_ruleset_dir in os.path.dirname(file_path) and raises_exception:
-                with pytest.raises(ValidationError):
-                    RuleSetModel(**contents)
-            else:
-                # THEN no ValidationError is raised
-                RuleSetModel(**contents)
+RULESET_DIR = Path("tests/resources/probes/ruleset")
+INVALID_RULESET_DIR = RULESET_DIR / "invalid"
+RULESET_FILES = sorted(
+    path for path in RULESET_DIR.rglob("*") if path.suffix in (".yaml", ".yml")
+)
+
+
+@pytest.mark.parametrize(
+    "file_path", RULESET_FILES, ids=lambda path: str(path.relative_to(RULESET_DIR))
+)
+def test_rulesets_have_valid_schemas_in_resources_dir(file_path: Path):
+    # GIVEN a ruleset YAML file from the resources directory
+    contents = yaml.load(file_path.read_bytes(), Loader=YamlLoader)
+    # WHEN the contents are loaded into a Pydantic RuleSetModel
+    raises_exception = file_path.stem.split("-")[0] == "raises"
+    if INVALID_RULESET_DIR in file_path.parents and raises_exception:
+        with pytest.raises(ValidationError):
+            RuleSetModel.model_validate(contents)
+    else:
+        # THEN no ValidationError is raised
+        RuleSetModel.model_validate(contents)
 
 
 def test_incorrect_schema_top_level_keys():
     # GIVEN a Ruleset with non-schema top-level keys is loaded
     incorrect_key = "foo"
-    yaml_content = f"""
-    name: Incorrect Ruleset
-    {incorrect_key}: bar
-    """
-    yaml_data = yaml.safe_load(yaml_content)
+    yaml_data = {"name": "Incorrect Ruleset", incorrect_key: "bar"}
     # THEN it fails validation
     with pytest.raises(ValidationError) as error:
-        RuleSetModel(**yaml_data)
+        RuleSetModel.model_validate(yaml_data)
 
     assert incorrect_key in str(error.value)
     assert "Extra inputs are not permitted" in str(error.value)